@@ -61,6 +61,21 @@ MEASURE_PERCENT_UI_EPSILON = 0.2
 MEASURE_FLOW_UI_EPSILON = 1e-3
 
 
+# -----------------------------
+# Device Identification
+# -----------------------------
+
+# Identification number (DDE 175) -> device category, used by the scanner and the poller
+DEVICE_CATEGORIES = {
+    7: "DMFC",   # Digital Mass Flow Controller
+    8: "DMFM",   # Digital Mass Flow Meter
+    9: "DEPC",   # Digital Electronic Pressure Controller
+    10: "DEPM",  # Digital Electronic Pressure Meter
+    12: "DLFC",  # Digital Liquid Flow Controller
+    13: "DLFM",  # Digital Liquid Flow Meter
+}
+
+
 # -----------------------------
 # Derived/Helper Values
 # -----------------------------
@@ -0,0 +1,49 @@
+# backend/error_patterns.py
+"""Connection-error phrases and poll error classification shared by the poller and the manager."""
+import re
+from functools import lru_cache
+
+
+# Lower-cased error phrases after which the port's master/instrument must be recreated
+RECONNECT_INDICATORS = ("bad file descriptor", "errno 9", "device not found", "port not open")
+# The poller also retries a failed write within the same poll cycle
+RECOVERABLE_INDICATORS = RECONNECT_INDICATORS + ("write failed",)
+
+# Read errors that mean the serial handle itself is gone (case-sensitive, as raised)
+SERIAL_LOST_INDICATORS = ("integer is required (got type NoneType)", "file descriptor", "Serial connection lost")
+
+# "(type: <error_type>)" tag the poller appends to its error signal; parsed back by the manager
+ERROR_TYPE_RE = re.compile(r"\(type: ([^)]+)\)")
+
+# Poll error classification, first match wins:
+# (phrases, error_type, should_clear_cache, should_reconnect)
+ERROR_RULES = (
+    (("bad file descriptor", "errno 9"), "bad_file_descriptor", True, True),
+    (("port that is not open",), "port_closed", True, True),
+    (("device disconnected", "device not found"), "device_disconnected", True, True),
+    (("timeout",), "timeout", False, False),
+    (("permission denied", "access denied"), "permission_denied", True, False),
+    (("no such file",), "device_not_found", True, False),
+    (("write failed",), "write_failed", True, True),
+)
+
+
+def _contains_any(msg, phrases):
+    """True if any of `phrases` occurs in `msg` (plain loop, no generator per call)."""
+    for p in phrases:
+        if p in msg:
+            return True
+    return False
+
+
+@lru_cache(maxsize=128)
+def classify_error(error_msg):
+    """
+    Return (error_type, should_clear_cache, should_reconnect) for a poll error message.
+    Cached: a failing port reports the same message every cycle until it recovers.
+    """
+    m = error_msg.lower()
+    for phrases, error_type, clear_cache, reconnect in ERROR_RULES:
+        if _contains_any(m, phrases):
+            return error_type, clear_cache, reconnect
+    return "communication", False, False
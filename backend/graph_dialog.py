@@ -1,24 +1,39 @@
+import numpy as np
 import pyqtgraph as pg
 from pyqtgraph import TextItem
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
 from PyQt5 import uic
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-import os, csv
+import os, csv, bisect
 from datetime import datetime, timedelta
 
+# Weekday abbreviations (German style)
+WEEKDAYS = ('Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So')
+
+
 class TimeAxis(pg.AxisItem):
+    def _iso_lookup(self):
+        # iso_map is replaced wholesale on reload, so sort it once per assignment, not per tick
+        if getattr(self, '_iso_src', None) is not self.iso_map:
+            pairs = sorted(self.iso_map, key=lambda tup: tup[0])
+            self._iso_src = self.iso_map
+            self._iso_xs = [x for x, _ in pairs]
+            self._iso_dts = [dt for _, dt in pairs]
+        return self._iso_xs, self._iso_dts
+
     def tickStrings(self, values, scale, spacing):
         # If ISO mode, show ISO strings as weekday abbreviation and hour:minute
         if hasattr(self, 'iso_mode') and self.iso_mode and hasattr(self, 'iso_map') and self.iso_map:
-            # Weekday abbreviations (German style)
-            weekdays = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
+            xs, dts = self._iso_lookup()
             labels = []
             for v in values:
                 # Find closest ISO string for this tick value
-                closest = min(self.iso_map, key=lambda tup: abs(tup[0] - v))
-                dt = closest[1]
-                wd = weekdays[dt.weekday()]
+                i = bisect.bisect_left(xs, v)
+                if i == len(xs) or (i > 0 and v - xs[i - 1] <= xs[i] - v):
+                    i -= 1
+                dt = dts[i]
+                wd = WEEKDAYS[dt.weekday()]
                 labels.append(f"{wd} {dt.hour:02d}:{dt.minute:02d}")
             return labels
         # Otherwise, show seconds as before
@@ -138,19 +153,21 @@ class GraphDialog(QDialog):
         return bool(self._axis_file_side.get(fname, False))
     
     def on_time_range_changed(self, idx):
-        # Get all x values from all curves
-        all_x = []
+        # Get the x extent over all curves (per-curve min/max on the numpy arrays, no merged copy)
+        lows, highs = [], []
         for curve in self.curves.values():
-            if hasattr(curve, 'xData') and curve.xData is not None:
-                all_x.extend(curve.xData)
-            elif hasattr(curve, 'getData'):  # fallback for PlotCurveItem
+            x = getattr(curve, 'xData', None)
+            if x is None and hasattr(curve, 'getData'):  # fallback for PlotCurveItem
                 x, _ = curve.getData()
-                if x is not None:
-                    all_x.extend(x)
-        if not all_x:
+            if x is None or len(x) == 0:
+                continue
+            x = np.asarray(x)
+            lows.append(x.min())
+            highs.append(x.max())
+        if not lows:
             return
-        min_x = min(all_x)
-        max_x = max(all_x)
+        min_x = float(min(lows))
+        max_x = float(max(highs))
         # Combobox index: 0=Full, 1=24h, 2=8h, 3=4h, 4=1h
         hours = [None, 24, 8, 4, 1][idx]
         if hours is None:
@@ -212,7 +229,8 @@ class GraphDialog(QDialog):
                 data_x = [(dt - t0).total_seconds() for dt in data_x_raw]
                 iso_map = list(zip(data_x, data_x_raw))
             else:
-                data_x = [t - t0 for t in data_x_raw]
+                # epoch seconds: offset the whole column in one array op
+                data_x = np.asarray(data_x_raw, dtype=float) - t0
         else:
             data_x = []
         if setpoint_x_raw and data_x_raw:
@@ -220,7 +238,7 @@ class GraphDialog(QDialog):
             if use_iso:
                 setpoint_x = [(dt - t0).total_seconds() for dt in setpoint_x_raw]
             else:
-                setpoint_x = [t - t0 for t in setpoint_x_raw]
+                setpoint_x = np.asarray(setpoint_x_raw, dtype=float) - t0
         else:
             setpoint_x = []
         return data_x, setpoint_x, iso_map
@@ -239,7 +257,7 @@ class GraphDialog(QDialog):
         return curve
 
     def plot_setpoints(self, setpoint_x, setpoint_y, usertag, color, on_right_axis=False):
-        if setpoint_x and setpoint_y:
+        if len(setpoint_x) and setpoint_y:
             scatter = pg.ScatterPlotItem(
                 x=setpoint_x,
                 y=setpoint_y,
@@ -256,7 +274,7 @@ class GraphDialog(QDialog):
             self._setpoint_items.append((scatter, on_right_axis))
 
     def add_curve_label(self, data_x, data_y, usertag, color, on_right_axis=False):
-        if data_x and data_y:
+        if len(data_x) and data_y:
             label = TextItem(usertag, color=color, anchor=(0.5, 1.0), border='w', fill=(0,0,0,150))
             target_viewbox = self.right_viewbox if on_right_axis else self.plot_widget
             target_viewbox.addItem(label)
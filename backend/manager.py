@@ -2,6 +2,7 @@
 from typing import Dict, List, Optional, Tuple
 import threading
 import json
+import re
 import os
 from contextlib import contextmanager
 from PyQt5.QtCore import QObject, pyqtSignal, QThread
@@ -13,6 +14,16 @@ import time
 from .error_logger import ErrorLogger
 from .poller import PortPoller
 from .constants import GAS_FACTORS_FILE
+from .error_patterns import ERROR_TYPE_RE, RECONNECT_INDICATORS, _contains_any
+
+
+# "<port>/<addr>: ..." prefix of poller error messages; port may itself contain "/"
+_POLLER_ERR_RE = re.compile(r"^\s*(?P<port_addr>(?P<port>[^:]*)/(?P<addr>[^:/]*?))\s*:")
+
+
+def _serial_of(master):
+    """Underlying pyserial port of a propar master, or None if it has none."""
+    return getattr(getattr(master, "propar", None), "serial", None)
 
 
 class ManagedInstrument:
@@ -24,11 +35,18 @@ class ManagedInstrument:
         self.address = int(address)
         self.channel = int(channel)
         self.db = master.db
+        self._params: Dict[int, dict] = {}  # dde_nr -> parameter bound to this node
 
     def _param(self, dde_nr: int, value=None, with_data: bool = False):
-        p = dict(self.db.get_parameter(int(dde_nr)))
-        p["node"] = self.address
+        dde_nr = int(dde_nr)
+        p = self._params.get(dde_nr)
+        if p is None:
+            p = self.db.get_parameter(dde_nr)  # already a copy of the db entry
+            p["node"] = self.address
+            self._params[dde_nr] = p
         if with_data:
+            # writes carry data, so they get their own copy
+            p = dict(p)
             p["data"] = value
         return p
 
@@ -68,9 +86,16 @@ class ManagedInstrument:
         return ok
 
     def read_parameters(self, parameters):
-        params = [dict(p) for p in parameters]
-        for p in params:
-            p["node"] = self.address
+        """
+        Chained read of `parameters` on this node.
+        Parameter lists already bound to this address are sent as-is (no per-call copies).
+        """
+        if all(p.get("node") == self.address for p in parameters):
+            params = parameters
+        else:
+            params = [dict(p) for p in parameters]
+            for p in params:
+                p["node"] = self.address
         return self.master.read_parameters(params)
 
 
@@ -143,9 +168,9 @@ class ProparManager(QObject):
         if self._scanner and self._scanner.isRunning():
             return # already scanning
         self.close_all_ports()
-        time.sleep(0.2)  # Add a small delay
         self.clear()
-        self._scanner = ProparScanner(ports=ports, baudrate=self._baudrate)
+        # The 0.2 s settle delay after closing ports runs on the scanner thread, not the UI thread
+        self._scanner = ProparScanner(ports=ports, baudrate=self._baudrate, start_delay=0.2)
         self._scanner.startedPort.connect(self.scanProgress)
         self._scanner.portError.connect(self.scanError)
         self._scanner.nodeFound.connect(self._onNodeFound)
@@ -230,13 +255,12 @@ class ProparManager(QObject):
                 # Verify the cached instrument is still valid
                 try:
                     # Quick test to see if the connection is still alive
-                    if hasattr(cached_inst.master, 'propar') and hasattr(cached_inst.master.propar, 'serial'):
-                        serial_port = cached_inst.master.propar.serial
-                        if serial_port and serial_port.is_open:
-                            return cached_inst
-                        else:
-                            # Connection is dead, remove from cache
-                            del self._shared_inst_cache[port][address]
+                    serial_port = _serial_of(cached_inst.master)
+                    if serial_port and serial_port.is_open:
+                        return cached_inst
+                    else:
+                        # Connection is dead, remove from cache
+                        del self._shared_inst_cache[port][address]
                 except Exception:
                     # Any error checking connection, remove from cache
                     self._shared_inst_cache[port].pop(address, None)
@@ -249,11 +273,12 @@ class ProparManager(QObject):
                 # Test the connection before caching
                 try:
                     # Connection recovery test
-                    if hasattr(inst.master, 'propar') and hasattr(inst.master.propar, 'serial'):
-                        if not inst.master.propar.serial.is_open:
+                    serial_port = _serial_of(inst.master)
+                    if serial_port is not None:
+                        if not serial_port.is_open:
                             # Attempt to reopen the connection
                             try:
-                                inst.master.propar.serial.open()
+                                serial_port.open()
                                 if self.error_logger:
                                     self.error_logger.log_error(
                                         port,
@@ -287,7 +312,7 @@ class ProparManager(QObject):
             except Exception as e:
                 # If instrument creation fails, try to recreate the master
                 error_msg = str(e).lower()
-                if any(err in error_msg for err in ["bad file descriptor", "errno 9", "device not found", "port not open"]):
+                if _contains_any(error_msg, RECONNECT_INDICATORS):
                     try:
                         # Force reconnection
                         self.force_reconnect_port(port)
@@ -466,92 +491,67 @@ class ProparManager(QObject):
         
         # Extract port and address from error message if possible
         try:
-            # Try to parse format like "COM3/5: error message" or "/dev/ttyUSB0/5: error message"
-            if "/" in msg and ":" in msg:
-                port_addr = msg.split(":")[0].strip()
-                if "/" in port_addr:
-                    # Handle different port formats:
-                    # Windows: "COM3/5" -> port="COM3", address="5"
-                    # Linux: "/dev/ttyUSB0/5" -> port="/dev/ttyUSB0", address="5"
-                    
-                    # Split from the right to get the last part as address
-                    parts = port_addr.rsplit("/", 1)
-                    if len(parts) == 2:
-                        port, address_str = parts
-                        
-                        # Try to convert address to integer
-                        try:
-                            address = int(address_str)
-                            
-                            # Determine error type from message content
-                            error_type = "communication"
-                            if "(type: " in msg:
-                                # Extract error type from enhanced error message
-                                try:
-                                    type_start = msg.find("(type: ") + 7
-                                    type_end = msg.find(")", type_start)
-                                    if type_end > type_start:
-                                        error_type = msg[type_start:type_end]
-                                except:
-                                    pass
-                            
-                            # Get instrument info for detailed logging
-                            instrument_info = self._get_instrument_info(port, address)
-                            
-                            # Log to error logger with appropriate error type
-                            if error_type == "port_closed":
-                                # Clear shared cache to force reconnection
-                                self.clear_shared_instrument_cache(port, address)
-                                self.error_logger.log_error(
-                                    port=port,
-                                    address=str(address),
-                                    error_type="hardware",
-                                    error_message="Serial port closed unexpectedly",
-                                    error_details=msg,
-                                    instrument_info=instrument_info
-                                )
-                            elif error_type == "timeout":
-                                self.error_logger.log_communication_error(
-                                    port=port,
-                                    address=str(address),
-                                    error_message="Communication timeout",
-                                    instrument_info=instrument_info
-                                )
-                            elif error_type in ["permission_denied", "device_not_found"]:
-                                self.error_logger.log_error(
-                                    port=port,
-                                    address=str(address),
-                                    error_type="hardware",
-                                    error_message=f"Port access error: {error_type}",
-                                    error_details=msg,
-                                    instrument_info=instrument_info
-                                )
-                            else:
-                                # Default communication error
-                                self.error_logger.log_communication_error(
-                                    port=port,
-                                    address=str(address),
-                                    error_message=msg,
-                                    instrument_info=instrument_info
-                                )
-                        except ValueError:
-                            # Address part is not a valid integer
-                            self.error_logger.log_error(
-                                port=port_addr,
-                                address="unknown",
-                                error_type="communication",
-                                error_message="Poller error (invalid address format)",
-                                error_details=msg
-                            )
-                    else:
-                        # Could not split properly
-                        self.error_logger.log_error(
-                            port=port_addr,
-                            address="unknown",
-                            error_type="communication",
-                            error_message="Poller error (parse failed)",
-                            error_details=msg
-                        )
+            # Format is "COM3/5: error message" or "/dev/ttyUSB0/5: error message";
+            # the address is the last "/" segment before the first ":"
+            m = _POLLER_ERR_RE.match(msg)
+            if m:
+                port, address_str = m.group("port"), m.group("addr")
+                try:
+                    address = int(address_str)
+                except ValueError:
+                    # Address part is not a valid integer
+                    self.error_logger.log_error(
+                        port=m.group("port_addr"),
+                        address="unknown",
+                        error_type="communication",
+                        error_message="Poller error (invalid address format)",
+                        error_details=msg
+                    )
+                    return
+
+                # Determine error type from message content
+                t = ERROR_TYPE_RE.search(msg)
+                error_type = t.group(1) if t else "communication"
+
+                # Get instrument info for detailed logging
+                instrument_info = self._get_instrument_info(port, address)
+
+                # Log to error logger with appropriate error type
+                if error_type == "port_closed":
+                    # Clear shared cache to force reconnection
+                    self.clear_shared_instrument_cache(port, address)
+                    self.error_logger.log_error(
+                        port=port,
+                        address=str(address),
+                        error_type="hardware",
+                        error_message="Serial port closed unexpectedly",
+                        error_details=msg,
+                        instrument_info=instrument_info
+                    )
+                elif error_type == "timeout":
+                    self.error_logger.log_communication_error(
+                        port=port,
+                        address=str(address),
+                        error_message="Communication timeout",
+                        instrument_info=instrument_info
+                    )
+                elif error_type in ["permission_denied", "device_not_found"]:
+                    self.error_logger.log_error(
+                        port=port,
+                        address=str(address),
+                        error_type="hardware",
+                        error_message=f"Port access error: {error_type}",
+                        error_details=msg,
+                        instrument_info=instrument_info
+                    )
+                else:
+                    # Default communication error
+                    self.error_logger.log_communication_error(
+                        port=port,
+                        address=str(address),
+                        error_message=msg,
+                        instrument_info=instrument_info
+                    )
             else:
                 # Generic error without specific port/address
                 self.error_logger.log_error(
@@ -605,11 +605,19 @@ class ProparManager(QObject):
         poller.request_fluid_change(address, int(new_index))
 
     def stop_all_pollers(self):
-        for port, (t, poller) in list(self._pollers.items()):
+        pollers = list(self._pollers.values())
+        # Signal every poller first so they wind down in parallel...
+        for t, poller in pollers:
             try:
                 poller.stop()
                 t.quit()
-                t.wait(1000)
+            except Exception:
+                pass
+        # ...then join them against one shared 1 s deadline instead of 1 s per thread
+        deadline = time.monotonic() + 1.0
+        for t, poller in pollers:
+            try:
+                t.wait(max(0, int((deadline - time.monotonic()) * 1000)))
             except Exception:
                 pass
         self._pollers.clear()
@@ -640,8 +648,8 @@ class ProparManager(QObject):
         # Store in temporary memory (by port/address)
         self._gas_factors[(port, address)] = factor
         
-        # Store persistently by serial number if available
-        if serial_nr:
+        # Store persistently by serial number if available (skip the disk write when unchanged)
+        if serial_nr and self._persistent_gas_factors.get(str(serial_nr)) != factor:
             self._persistent_gas_factors[str(serial_nr)] = factor
             self._save_gas_factors()
 
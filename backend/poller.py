@@ -2,8 +2,10 @@
 from PyQt5.QtCore import QObject, pyqtSignal
 import os
 import random
-import time, heapq, queue
+import time, heapq, queue, threading
 from propar import PP_STATUS_OK, PP_STATUS_TIMEOUT_ANSWER, pp_status_codes
+from .constants import DEVICE_CATEGORIES
+from .error_patterns import RECOVERABLE_INDICATORS, SERIAL_LOST_INDICATORS, _contains_any, classify_error
 
 FSETPOINT_DDE = 206     # fSetpoint
 FMEASURE_DDE = 205      # fMeasure
@@ -20,6 +22,41 @@ IGNORE_TIMEOUT_ON_SETPOINT = False
 MIN_SAFE_PERIOD = 0.5
 DIAG_INTERVAL_SEC = 10.0
 
+# Error types that get a short back-off before the next poll
+_CRITICAL_ERRORS = frozenset(("bad_file_descriptor", "port_closed", "device_disconnected", "write_failed"))
+
+
+def _parse_read_results(params, values):
+    """
+    Turn a chained read response into ({dde: ok}, {dde: value}).
+    Strings are stripped and bytes decoded; a missing or failed entry maps to None.
+    """
+    ok, data = {}, {}
+    for p, v in zip(params, values):
+        dde = p["dde_nr"]
+        if v is None:
+            ok[dde] = False
+            data[dde] = None
+            continue
+        if isinstance(v, dict):
+            status = v.get("status")
+            val = v.get("data")
+        else:
+            status = None
+            val = v
+        ok[dde] = (status == 0 and val is not None)
+        # Clean string values and handle different data types
+        if isinstance(val, str):
+            val = val.strip()
+        elif isinstance(val, bytes):
+            try:
+                val = val.decode('utf-8', errors='ignore').strip()
+            except Exception:
+                val = None
+                ok[dde] = False
+        data[dde] = val
+    return ok, data
+
 
 class PortPoller(QObject):
     measured = pyqtSignal(object)       # emits {"port", "address", "data": {"fmeasure", "name"}, "ts"}
@@ -37,6 +74,8 @@ class PortPoller(QObject):
         self._heap = []                 # (next_due, address, period)
         self._known = {}                # address -> (period)
         self._cmd_q = queue.Queue()     # serialize writes/one-off reads
+        self._wake = threading.Event()  # set when a command is queued or stop() is called
+        self._stopped = threading.Event()  # set by stop(); cuts settle waits short
         self._param_cache = {}          # NEW: address -> [param dicts]  ← avoid get_parameters() every time
         self._last_name = {}
         # Add small delay for shared USB devices to reduce contention
@@ -52,41 +91,56 @@ class PortPoller(QObject):
 
     def request_setpoint_flow(self, address: int, flow_value: float):
         """Queue a write of fSetpoint (engineering units) for this instrument."""
-        self._cmd_q.put(("fset_flow", int(address), float(flow_value)))
+        self._enqueue(("fset_flow", int(address), float(flow_value)))
     
     def request_setpoint_pct(self, address: int, pct_value: float, emit_log: bool = True):
         """Queue a write of Setpoint (percentage units) for this instrument."""
-        self._cmd_q.put(("set_pct", int(address), float(pct_value), bool(emit_log)))
+        self._enqueue(("set_pct", int(address), float(pct_value), bool(emit_log)))
 
     def request_setpoint_slope(self, address: int, slope_value: int):
         """Queue a write of Setpoint slope (x 0.1 sec) for this instrument."""
-        self._cmd_q.put(("set_slope", int(address), int(slope_value)))
+        self._enqueue(("set_slope", int(address), int(slope_value)))
 
     def request_usertag(self, address: int, usertag: str):
         """Queue a write of Setpoint (percentage units) for this instrument."""
-        self._cmd_q.put(("set_usertag", int(address), str(usertag)))
+        self._enqueue(("set_usertag", int(address), str(usertag)))
 
     def add_node(self, address, period=None):
         period = max(float(period or self.default_period), MIN_SAFE_PERIOD)
         if address in self._known:
             self._known[address] = period
             heapq.heappush(self._heap, (time.monotonic() + 0.01, address, period))
+            self._wake.set()
             return
         # small staggering based on current count to avoid bursts
         t0 = time.monotonic() + (len(self._known) * 0.02)
         self._known[address] = period
         heapq.heappush(self._heap, (t0, address, period))
         print(f"Node {address} added to {self.port} poller")
+        self._wake.set()  # the loop may be sleeping until a later due time
 
     def remove_node(self, address):
         self._known.pop(address, None)  # lazy removal: heap entries naturally expire
 
     # Optional: queue a command (executes on the same thread)
     def request_fluid_change(self, address, new_index):
-        self._cmd_q.put(("fluid", address, int(new_index)))
+        self._enqueue(("fluid", address, int(new_index)))
 
     def stop(self):
         self._running = False
+        self._stopped.set()
+        self._wake.set()
+
+    def _enqueue(self, cmd):
+        self._cmd_q.put(cmd)
+        self._wake.set()
+
+    def _wait(self, timeout):
+        """Sleep until `timeout` elapses or a command/stop wakes the loop early."""
+        if not self._cmd_q.empty():
+            return
+        self._wake.wait(timeout)
+        self._wake.clear()
 
     def _status_code(self, res):
         if res is True:
@@ -148,6 +202,12 @@ class PortPoller(QObject):
         self._diag["verify_failed"] += 1
         return False, last_res, last_rb
 
+    def _read_many(self, inst, ddes):
+        """Read several DDEs in one chained request; returns {dde: value or None}."""
+        params = inst.db.get_parameters(ddes)
+        ok, data = _parse_read_results(params, inst.read_parameters(params) or [])
+        return {d: (data.get(d) if ok.get(d) else None) for d in ddes}
+
     def _emit_diag_if_due(self):
         if not self._diag_enabled:
             return
@@ -196,25 +256,28 @@ class PortPoller(QObject):
                         safe_arg = 0
                     applied, res, _rb = self._write_with_timeout_retry(inst, FIDX_DDE, safe_arg, verify_dde=FIDX_DDE)
                     if applied:
+                        name_now = None
                         deadline = time.monotonic() + 5.0
-                        time.sleep(0.2)  # tiny settle
-                        while time.monotonic() < deadline:
+                        self._stopped.wait(0.2)  # tiny settle
+                        while time.monotonic() < deadline and not self._stopped.is_set():
                             try:
-                                idx_now = inst.readParameter(FIDX_DDE)
-                                name_now = inst.readParameter(FNAME_DDE)
+                                vals = self._read_many(inst, [FIDX_DDE, FNAME_DDE])
+                                idx_now = vals[FIDX_DDE]
+                                name_now = vals[FNAME_DDE]
                                 if idx_now == safe_arg and name_now:
                                     applied = True
                                     break
                             except Exception:
                                 pass
-                            time.sleep(0.15)
+                            self._stopped.wait(0.15)
                     if applied:
                         # Read back capacity and unit while we have the instrument locked
                         cap_now = None
                         unit_now = None
                         try:
-                            cap_now = inst.readParameter(CAPACITY_DDE)
-                            unit_now = inst.readParameter(129)
+                            vals = self._read_many(inst, [CAPACITY_DDE, 129])
+                            cap_now = vals[CAPACITY_DDE]
+                            unit_now = vals[129]
                         except Exception:
                             pass
                         self.telemetry.emit({
@@ -388,13 +451,14 @@ class PortPoller(QObject):
                     })
             # 2) Fairly pick the next due instrument
             if not self._heap:
-                time.sleep(0.1)
+                self._wait(0.1)
                 continue
 
             due0, addr0, per0 = self._heap[0]
             sleep_for = max(0.0, due0 - now)
             if sleep_for > 0:
-                time.sleep(min(sleep_for, 0.005))
+                # deadline-driven: wake once when the next node is due, or earlier for queued commands
+                self._wait(sleep_for)
                 continue
 
             first = heapq.heappop(self._heap)  # (due0, addr0, per0)
@@ -425,7 +489,7 @@ class PortPoller(QObject):
             while retry_count <= max_retries and not operation_success:
                 try:
                     # Add small delay for shared USB devices to reduce contention
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     time_since_last = current_time - self._last_operation_time
                     min_interval = 0.001  # 1ms minimum between operations on same port
                     if time_since_last < min_interval:
@@ -464,12 +528,14 @@ class PortPoller(QObject):
                             retry_count = max_retries + 1
                             break  # Skip this poll cycle gracefully
                     
-                    self._last_operation_time = time.time()
+                    self._last_operation_time = time.monotonic()
 
                     params = self._param_cache.get(address)
                     if params is None:
                         PARAMS = [FMEASURE_DDE, FNAME_DDE, MEASURE_DDE, SETPOINT_DDE, SETPOINT_SLOPE_DDE, FSETPOINT_DDE, CAPACITY_DDE, IDENT_NR_DDE]
                         params = inst.db.get_parameters(PARAMS)
+                        for p in params:
+                            p["node"] = address  # bind once so read_parameters can reuse the list
                         self._param_cache[address] = params
                     
                     t0 = time.perf_counter()
@@ -479,7 +545,7 @@ class PortPoller(QObject):
                     except (TypeError, OSError, Exception) as read_error:
                         # Handle various connection-related errors
                         error_msg = str(read_error)
-                        if "integer is required (got type NoneType)" in error_msg or "file descriptor" in error_msg or "Serial connection lost" in error_msg:
+                        if _contains_any(error_msg, SERIAL_LOST_INDICATORS):
                             if self.manager.error_logger:
                                 self.manager.error_logger.log_error(
                                     self.port,
@@ -509,43 +575,17 @@ class PortPoller(QObject):
                     operation_success = True  # If we get here, the operation succeeded
                     
                     # Process the results
-                    ok, data = {}, {}
-                    for p, v in zip(params, values):
-                        dde = p["dde_nr"]
-                        # Enhanced None and type checking
-                        if v is None:
-                            ok[dde] = False
-                            data[dde] = None
-                        else:
-                            status = v.get("status") if isinstance(v, dict) else None
-                            val = v.get("data") if isinstance(v, dict) else v
-                            
-                            ok[dde] = (status == 0 and val is not None)
-                            
-                            # Clean string values and handle different data types
-                            if isinstance(val, str):
-                                val = val.strip()
-                            elif isinstance(val, bytes):
-                                try:
-                                    val = val.decode('utf-8', errors='ignore').strip()
-                                except:
-                                    val = None
-                                    ok[dde] = False
-                            
-                            data[dde] = val
+                    ok, data = _parse_read_results(params, values)
                     
                     # Continue with normal processing only if operation succeeded
                     break
                     
                 except Exception as e:
                     retry_count += 1
-                    error_msg = str(e).lower()
                     
                     # Check if this is a recoverable error
-                    is_recoverable = any(err in error_msg for err in [
-                        "bad file descriptor", "errno 9", "write failed", 
-                        "device not found", "port not open"
-                    ])
+                    error_msg = str(e).lower()
+                    is_recoverable = _contains_any(error_msg, RECOVERABLE_INDICATORS)
                     
                     if is_recoverable and retry_count <= max_retries:
                         # Clear cache and try to recover
@@ -568,6 +608,8 @@ class PortPoller(QObject):
                 continue
 
             try:
+                # one wall-clock stamp shared by every signal emitted for this read
+                ts = time.time()
                 # after building ok/data
                 name_ok = ok.get(FNAME_DDE)
                 if name_ok:
@@ -607,7 +649,7 @@ class PortPoller(QObject):
                             capacity_150_percent = capacity_val * 1.5
                             
                             self.telemetry.emit({
-                                "ts": time.time(), 
+                                "ts": ts, 
                                 "port": self.port, 
                                 "address": address,
                                 "kind": "validation_skip", 
@@ -624,19 +666,7 @@ class PortPoller(QObject):
                         pass
                     else:
                         # Determine device category based on identification number
-                        device_category = "UNKNOWN"
-                        if ident_nr == 7:
-                            device_category = "DMFC"  # Digital Mass Flow Controller
-                        elif ident_nr == 8:
-                            device_category = "DMFM"  # Digital Mass Flow Meter
-                        elif ident_nr == 12:
-                            device_category = "DLFC"  # Digital Liquid Flow Controller  
-                        elif ident_nr == 13:
-                            device_category = "DLFM"  # Digital Liquid Flow Meter
-                        elif ident_nr == 9:
-                            device_category = "DEPC"  # Digital Electronic Pressure Controller
-                        elif ident_nr == 10:
-                            device_category = "DEPM"  # Digital Electronic Pressure Meter
+                        device_category = DEVICE_CATEGORIES.get(ident_nr, "UNKNOWN")
 
                         # UI update (use last known name; may be None on first cycles)
                         fmeasure_val = data.get(FMEASURE_DDE)
@@ -656,7 +686,7 @@ class PortPoller(QObject):
                             # Emit raw telemetry if gas factor is applied (not 1.0)
                             if gas_factor != 1.0:
                                 self.telemetry.emit({
-                                    "ts": time.time(), "port": self.port, "address": address,
+                                    "ts": ts, "port": self.port, "address": address,
                                     "kind": "measure", "name": "fMeasure_raw", "value": safe_fmeasure_raw
                                 })
                         else:
@@ -676,7 +706,7 @@ class PortPoller(QObject):
                             "device_category": device_category,
                             "ident_nr": ident_nr,
                             },
-                            "ts": time.time(),
+                            "ts": ts,
                         })
                     # telemetry does not need the name at all
                     fmeasure_val = data.get(FMEASURE_DDE)
@@ -694,7 +724,7 @@ class PortPoller(QObject):
                                 safe_fmeasure = safe_fmeasure_raw
                             
                             self.telemetry.emit({
-                                "ts": time.time(), "port": self.port, "address": address,
+                                "ts": ts, "port": self.port, "address": address,
                                 "kind": "measure", "name": "fMeasure", "value": safe_fmeasure
                             })
                         except (ValueError, TypeError, AttributeError):
@@ -702,36 +732,8 @@ class PortPoller(QObject):
                             pass
             except Exception as e:
                 # Enhanced error handling with specific error types and recovery mechanisms
-                error_msg = str(e)
-                error_type = "communication"
-                should_clear_cache = False
-                should_reconnect = False
-                
                 # Classify error types for better handling
-                if "bad file descriptor" in error_msg.lower() or "errno 9" in error_msg.lower():
-                    error_type = "bad_file_descriptor"
-                    should_clear_cache = True
-                    should_reconnect = True
-                elif "port that is not open" in error_msg.lower():
-                    error_type = "port_closed"
-                    should_clear_cache = True
-                    should_reconnect = True
-                elif "device disconnected" in error_msg.lower() or "device not found" in error_msg.lower():
-                    error_type = "device_disconnected"
-                    should_clear_cache = True
-                    should_reconnect = True
-                elif "timeout" in error_msg.lower():
-                    error_type = "timeout"
-                elif "permission denied" in error_msg.lower() or "access denied" in error_msg.lower():
-                    error_type = "permission_denied"
-                    should_clear_cache = True
-                elif "no such file" in error_msg.lower():
-                    error_type = "device_not_found"
-                    should_clear_cache = True
-                elif "write failed" in error_msg.lower():
-                    error_type = "write_failed"
-                    should_clear_cache = True
-                    should_reconnect = True
+                error_type, should_clear_cache, should_reconnect = classify_error(str(e))
                 
                 # Recovery actions
                 if should_clear_cache:
@@ -754,7 +756,7 @@ class PortPoller(QObject):
                 self.error.emit(f"Poll error on {self.port}/{address}: {e} (type: {error_type})")
                 
                 # For critical errors, add a small delay before continuing
-                if error_type in ["bad_file_descriptor", "port_closed", "device_disconnected", "write_failed"]:
+                if error_type in _CRITICAL_ERRORS:
                     time.sleep(0.1)
 
             # remember who we just serviced
@@ -7,7 +7,10 @@ import serial
 from propar import master as ProparMaster # your uploaded lib
 #from propar import instrument as ProparInstrument  
 from .types import NodeInfo
+from .constants import DEVICE_CATEGORIES
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import time
 
 
@@ -138,27 +141,22 @@ def _apply_fluid_and_get_name(master, address, idx, settle_timeout=5.0):
     return name
 
 
+# Serial device globs probed by default (built once at import)
+_PORT_PATTERNS = (
+    '/dev/ttyUSB*', # USB-serial adapters
+    #'/dev/ttyACM*', # CDC ACM devices (many dev boards)
+    #'/dev/serial0', # primary UART symlink on Pi
+    #'/dev/ttyAMA0', # PL011 UART (older/newer Pi variants)
+)
+
+
 def _default_ports() -> List[str]:
     """Return common serial device paths on Raspberry Pi/Linux.
     Includes USB CDC ACM, USB serial, and the onboard UART symlinks.
+    Not cached: every scan must see adapters plugged in since the last one.
     """
-    patterns = [
-        '/dev/ttyUSB*', # USB-serial adapters
-        #'/dev/ttyACM*', # CDC ACM devices (many dev boards)
-        #'/dev/serial0', # primary UART symlink on Pi
-        #'/dev/ttyAMA0', # PL011 UART (older/newer Pi variants)
-    ]
-    found = []
-    for pat in patterns:
-        found.extend(glob.glob(pat))
     # de-duplicate while preserving order
-    seen = set()
-    ordered = []
-    for f in found:
-        if f not in seen:
-            ordered.append(f)
-            seen.add(f)
-    return ordered
+    return list(dict.fromkeys(f for pat in _PORT_PATTERNS for f in glob.glob(pat)))
 
 class ProparScanner(QThread):
     """
@@ -175,10 +173,12 @@ class ProparScanner(QThread):
     finishedScanning = pyqtSignal()
 
 
-    def __init__(self, ports: Optional[List[str]] = None, baudrate: int = 38400, parent: Optional[QObject] = None):
+    def __init__(self, ports: Optional[List[str]] = None, baudrate: int = 38400, parent: Optional[QObject] = None,
+                 start_delay: float = 0.0):
         super().__init__(parent)
         self._ports = ports or _default_ports()
         self._baudrate = baudrate
+        self._start_delay = float(start_delay)  # settle time for just-closed ports, spent off the UI thread
         self._stop = False
         self.instrument_list = []  # Store instruments with numbers
 
@@ -235,118 +235,158 @@ class ProparScanner(QThread):
         
 
     def run(self):
-        instrument_counter = 1
-        for port in list(self._ports):
-            if self._stop:
-                break
-            self.startedPort.emit(port)                 # <-- emit start for this port
-            m = None
-            try:
-                m = ProparMaster(port, baudrate=self._baudrate)
-                nodes = m.get_nodes()
-                for n in nodes:
-                    if self._stop:
-                        break
-                    info = NodeInfo(
-                        port=port,
-                        address=int(n['address']),
-                        dev_type=str(n['type']),
-                        serial=str(n['serial']),
-                        id_str=str(n['id']),
-                        channels=int(n['channels'])
-                    )
-                    # Assign a number to each instrument
-                    numbered_info = {
-                        "number": instrument_counter,
-                        "info": info
-                    }
-                    info.number = instrument_counter  # Add number attribute to NodeInfo
-
-                    vals = _read_dde_stable(m, info.address, [115, 25, 21, 129, 24, 206, 91, 175], debug=False)
-                    info.usertag, info.fluid, info.capacity, info.unit, orig_idx, info.fsetpoint, info.model = (
-                        vals.get(115), vals.get(25), vals.get(21), vals.get(129), vals.get(24), vals.get(206), vals.get(91)  
-                    )
-                    
-                    # Add device type detection using parameter 175
-                    device_type_id = vals.get(175)
-                    if device_type_id is not None:
-                        device_types = {
-                            7: "DMFC", 8: "DMFM", 9: "DEPC", 10: "DEPM", 
-                            12: "DLFC", 13: "DLFM"
-                        }
-                        info.device_type = device_types.get(device_type_id, f"Unknown({device_type_id})")
+        if self._start_delay > 0:
+            time.sleep(self._start_delay)
+        ports = list(self._ports)
+        self._instrument_counter = 1
+        if len(ports) <= 1:
+            for port in ports:
+                self._scan_port(port, self._emit_node)
+        else:
+            # Each port has its own master and serial line, so ports are scanned concurrently.
+            # Nodes are still numbered in port order: the earliest unfinished port's nodes are
+            # emitted as they arrive, later ports' nodes wait until every earlier port is done.
+            found = queue.Queue()
+
+            def scan(idx, port):
+                try:
+                    self._scan_port(port, lambda info: found.put((idx, info)))
+                finally:
+                    found.put((idx, None))  # this port is done
+
+            pending = [[] for _ in ports]
+            done = [False] * len(ports)
+            current = 0
+            with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+                for idx, port in enumerate(ports):
+                    pool.submit(scan, idx, port)
+                while current < len(ports):
+                    idx, info = found.get()
+                    if info is None:
+                        done[idx] = True
+                    elif idx == current:
+                        self._emit_node(info)
                     else:
-                        info.device_type = "Unknown"
-                    
-                    # Check for critical parameters but be more flexible
-                    missing_params = []
-                    if info.capacity is None:
-                        missing_params.append("capacity(21)")
-                    if info.unit is None:
-                        missing_params.append("unit(129)")
-                    if info.model is None:
-                        missing_params.append("model(91)")
-                    
-                    # Only skip if we're missing too many critical parameters
-                    # Allow instruments with at least model OR capacity to proceed
-                    if info.model is None and info.capacity is None:
-                        self.portError.emit(port, f"Essential parameters missing for instrument {info.address}: {', '.join(missing_params)}")
-                        continue
-                    elif missing_params:
-                        # Log warning but continue
-                        print(f"Warning: Some parameters missing for instrument {info.address}: {', '.join(missing_params)}")
+                        pending[idx].append(info)
+                    # Move past finished ports, releasing what the next port has buffered so far
+                    while current < len(ports) and done[current]:
+                        current += 1
+                        if current < len(ports):
+                            for buffered in pending[current]:
+                                self._emit_node(buffered)
+                            pending[current].clear()
+        self.finishedScanning.emit()
+
+    def _emit_node(self, info: NodeInfo):
+        """Number a scanned node and publish it (called on the scanner thread)."""
+        # Assign a number to each instrument
+        numbered_info = {
+            "number": self._instrument_counter,
+            "info": info
+        }
+        info.number = self._instrument_counter  # Add number attribute to NodeInfo
+        self.instrument_list.append(numbered_info)
+        self._instrument_counter += 1
+        self.nodeFound.emit(info)
+
+    def _scan_port(self, port: str, on_node):
+        """Scan one port, passing each fully populated node to `on_node` as soon as it is read."""
+        if self._stop:
+            return
+        self.startedPort.emit(port)                 # <-- emit start for this port
+        m = None
+        try:
+            m = ProparMaster(port, baudrate=self._baudrate)
+            nodes = m.get_nodes()
+            for n in nodes:
+                if self._stop:
+                    break
+                info = NodeInfo(
+                    port=port,
+                    address=int(n['address']),
+                    dev_type=str(n['type']),
+                    serial=str(n['serial']),
+                    id_str=str(n['id']),
+                    channels=int(n['channels'])
+                )
+                vals = _read_dde_stable(m, info.address, [115, 25, 21, 129, 24, 206, 91, 175], debug=False)
+                info.usertag, info.fluid, info.capacity, info.unit, orig_idx, info.fsetpoint, info.model = (
+                    vals.get(115), vals.get(25), vals.get(21), vals.get(129), vals.get(24), vals.get(206), vals.get(91)  
+                )
+                
+                # Add device type detection using parameter 175
+                device_type_id = vals.get(175)
+                if device_type_id is not None:
+                    info.device_type = DEVICE_CATEGORIES.get(device_type_id, f"Unknown({device_type_id})")
+                else:
+                    info.device_type = "Unknown"
+                
+                # Check for critical parameters but be more flexible
+                missing_params = []
+                if info.capacity is None:
+                    missing_params.append("capacity(21)")
+                if info.unit is None:
+                    missing_params.append("unit(129)")
+                if info.model is None:
+                    missing_params.append("model(91)")
+                
+                # Only skip if we're missing too many critical parameters
+                # Allow instruments with at least model OR capacity to proceed
+                if info.model is None and info.capacity is None:
+                    self.portError.emit(port, f"Essential parameters missing for instrument {info.address}: {', '.join(missing_params)}")
+                    continue
+                elif missing_params:
+                    # Log warning but continue
+                    print(f"Warning: Some parameters missing for instrument {info.address}: {', '.join(missing_params)}")
+                
+                # Debug logging for successful parameter reads
+                print(f"Instrument {info.address}: capacity={info.capacity}, unit={info.unit}, model={info.model}, device_type={info.device_type}")
+                rows = []
+                try:
+                    # Add timeout protection for fluid table scanning
+                    scan_start_time = time.time()
+                    max_scan_time = 25.0  # 25 second timeout for complete fluid scan
                     
-                    # Debug logging for successful parameter reads
-                    print(f"Instrument {info.address}: capacity={info.capacity}, unit={info.unit}, model={info.model}, device_type={info.device_type}")
-                    rows = []
-                    try:
-                        # Add timeout protection for fluid table scanning
-                        scan_start_time = time.time()
-                        max_scan_time = 25.0  # 25 second timeout for complete fluid scan
-                        
-                        for idx in range(0, 8):
-                            if self._stop:
-                                break
-                                
-                            # Check for timeout
-                            if time.time() - scan_start_time > max_scan_time:
-                                self.portError.emit(port, f"Fluid scan timeout for instrument {info.address}")
-                                break
+                    for idx in range(0, 8):
+                        if self._stop:
+                            break
                             
-                            try:
-                                name = _apply_fluid_and_get_name(m, info.address, idx, settle_timeout=1.0)
-                                if name and name.strip():   # not None, empty, or whitespace-only
-                                    rows.append({"index": idx, "name": name.strip()})
-                            except Exception as e:
-                                # Log individual fluid read failure but continue
-                                continue
-                           # if not self._write_dde(m, info.address, 24, idx):
-                            #    continue
-
-                            #vals = self._read_dde(m, info.address, [25]) 
-                            #name= vals.get(25)
-
-                            #if name not in (None, "", b""):
-                            #    rows.append({
-                            #        "index": idx,
-                            #        "name": name,
-                            #    })
-                    finally:
-                        if orig_idx is not None:
-                            _write_dde_ok(m, info.address, 24, int(orig_idx))
-                    
-                    info.fluids_table = rows
-                    self.instrument_list.append(numbered_info)
-                    instrument_counter += 1
-                    self.nodeFound.emit(info)
-            except serial.SerialException as e:
-                self.portError.emit(port, f"Serial communication error: {e}")
-            except Exception as e:
-                self.portError.emit(port, f"Unexpected scanning error: {str(e)[:100]}...")  # Truncate long error messages
-            finally:
-                if m is not None:
-                    try:
-                        m.stop()
-                    except Exception:
-                        pass
-        self.finishedScanning.emit()
\ No newline at end of file
+                        # Check for timeout
+                        if time.time() - scan_start_time > max_scan_time:
+                            self.portError.emit(port, f"Fluid scan timeout for instrument {info.address}")
+                            break
+                        
+                        try:
+                            name = _apply_fluid_and_get_name(m, info.address, idx, settle_timeout=1.0)
+                            if name and name.strip():   # not None, empty, or whitespace-only
+                                rows.append({"index": idx, "name": name.strip()})
+                        except Exception as e:
+                            # Log individual fluid read failure but continue
+                            continue
+                       # if not self._write_dde(m, info.address, 24, idx):
+                        #    continue
+
+                        #vals = self._read_dde(m, info.address, [25]) 
+                        #name= vals.get(25)
+
+                        #if name not in (None, "", b""):
+                        #    rows.append({
+                        #        "index": idx,
+                        #        "name": name,
+                        #    })
+                finally:
+                    if orig_idx is not None:
+                        _write_dde_ok(m, info.address, 24, int(orig_idx))
+                
+                info.fluids_table = rows
+                on_node(info)
+        except serial.SerialException as e:
+            self.portError.emit(port, f"Serial communication error: {e}")
+        except Exception as e:
+            self.portError.emit(port, f"Unexpected scanning error: {str(e)[:100]}...")  # Truncate long error messages
+        finally:
+            if m is not None:
+                try:
+                    m.stop()
+                except Exception:
+                    pass
@@ -1,7 +1,6 @@
 from PyQt5 import QtCore
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QThread, QTimer
 import csv, os, time, queue
-from statistics import mean
 from .constants import LOG_DIR, SECONDS_PER_MINUTE, TELEMETRY_QUEUE_TICK_MS
 
 class TelemetryLogWorker(QObject):
@@ -28,9 +27,13 @@ class TelemetryLogWorker(QObject):
         self._q = queue.Queue()
         self._fh = None
         self._count_since_flush = 0
-        self._fmeasure_buffer = []
-        self._fmeasure_raw_buffer = []  # Separate buffer for raw values
+        # Running (sum, count) per interval instead of buffering every sample
+        self._fmeasure_sum = 0.0
+        self._fmeasure_count = 0
+        self._fmeasure_raw_sum = 0.0    # Separate accumulator for raw values
+        self._fmeasure_raw_count = 0
         self._last_avg_time = time.time()
+        self._iso_cache = (None, "")     # (whole second, formatted iso) for the last row written
         self.request_stop.connect(self.stop)
 
     @pyqtSlot()
@@ -68,9 +71,11 @@ class TelemetryLogWorker(QObject):
                 
                 if isinstance(val, (int, float)):
                     if name == "fMeasure":
-                        self._fmeasure_buffer.append(val)
+                        self._fmeasure_sum += val
+                        self._fmeasure_count += 1
                     elif name == "fMeasure_raw":
-                        self._fmeasure_raw_buffer.append(val)
+                        self._fmeasure_raw_sum += val
+                        self._fmeasure_raw_count += 1
         except queue.Empty:
             pass
 
@@ -86,27 +91,35 @@ class TelemetryLogWorker(QObject):
         #        self._interval = min(300, self._interval * 2)  # Increase interval, maximum 5 minutes
 
         # Write the averages if the interval has elapsed
-        if now - self._last_avg_time >= self._interval and (self._fmeasure_buffer or self._fmeasure_raw_buffer):
+        if now - self._last_avg_time >= self._interval and (self._fmeasure_count or self._fmeasure_raw_count):
             self._write_averages(now)
 
+    def _iso(self, ts):
+        # iso has whole-second resolution, so format at most once per second
+        sec = int(ts)
+        if sec != self._iso_cache[0]:
+            self._iso_cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)))
+        return self._iso_cache[1]
+
     def _write_averages(self, ts=None):
         ts = ts or time.time()
-        iso = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+        iso = self._iso(ts)
+        ts_str = "%.3f" % ts  # shared by both average rows
         
         # Write compensated fMeasure average
-        if self._fmeasure_buffer:
-            avg_val = mean(self._fmeasure_buffer)
+        if self._fmeasure_count:
+            avg_val = self._fmeasure_sum / self._fmeasure_count
             
             row = [
-                f"{ts:.3f}",
+                ts_str,
                 iso,
                 self._filter_port or "",
                 self._filter_address or "",
                 "measure",
                 "fMeasure",
-                f"{avg_val:.5f}",
+                "%.5f" % avg_val,
                 "",
-                f"{len(self._fmeasure_buffer)} samples",
+                f"{self._fmeasure_count} samples",
                 self._usertag or ""
             ]
             
@@ -115,22 +128,23 @@ class TelemetryLogWorker(QObject):
             except Exception as e:
                 self.error.emit(f"fMeasure averaged write failed: {e}")
             
-            self._fmeasure_buffer.clear()
+            self._fmeasure_sum = 0.0
+            self._fmeasure_count = 0
         
         # Write raw fMeasure_raw average
-        if self._fmeasure_raw_buffer:
-            avg_raw_val = mean(self._fmeasure_raw_buffer)
+        if self._fmeasure_raw_count:
+            avg_raw_val = self._fmeasure_raw_sum / self._fmeasure_raw_count
             
             row = [
-                f"{ts:.3f}",
+                ts_str,
                 iso,
                 self._filter_port or "",
                 self._filter_address or "",
                 "measure",
                 "fMeasure_raw",
-                f"{avg_raw_val:.5f}",
+                "%.5f" % avg_raw_val,
                 "",
-                f"{len(self._fmeasure_raw_buffer)} samples",
+                f"{self._fmeasure_raw_count} samples",
                 self._usertag or ""
             ]
             
@@ -139,7 +153,8 @@ class TelemetryLogWorker(QObject):
             except Exception as e:
                 self.error.emit(f"fMeasure_raw averaged write failed: {e}")
             
-            self._fmeasure_raw_buffer.clear()
+            self._fmeasure_raw_sum = 0.0
+            self._fmeasure_raw_count = 0
         
         # Flush the file
         try:
@@ -179,10 +194,10 @@ class TelemetryLogWorker(QObject):
     def _write_event_row(self, rec):
         try:
             ts = rec.get("ts", time.time())
-            iso = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+            iso = self._iso(ts)
             
             row = [
-                f"{ts:.3f}",
+                "%.3f" % ts,
                 iso,
                 rec.get("port", ""),
                 rec.get("address", ""),
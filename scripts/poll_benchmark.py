@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import argparse
+import array
 import glob
 import statistics
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 # External lib you already use
@@ -13,6 +15,7 @@ from propar import master as ProparMaster, instrument as ProparInstrument
 DEFAULT_BAUD = 38400
 DEFAULT_DDES = [205]  # fMeasure
 USB_PATTERNS = ['/dev/ttyUSB*']  # simple default scan
+SPIN_THRESHOLD = 0.0005  # below this, busy-wait instead of sleeping (OS sleep granularity)
 
 def find_ports(patterns: List[str]) -> List[str]:
     found = []
@@ -27,19 +30,27 @@ def find_ports(patterns: List[str]) -> List[str]:
             seen.add(f)
     return ordered
 
+def _discover_port(port: str, baudrate: int):
+    try:
+        m = ProparMaster(port, baudrate=baudrate)
+        nodes = m.get_nodes() or []
+        addrs = [int(n['address']) for n in nodes]
+        try:
+            m.close()
+        except Exception:
+            pass
+        return addrs
+    except Exception as e:
+        print(f"[WARN] Could not open {port}: {e}", file=sys.stderr)
+        return None
+
 def discover_nodes(ports: List[str], baudrate: int) -> Dict[str, List[int]]:
+    # One port per USB adapter: discover them concurrently, keep the input order
     mapping: Dict[str, List[int]] = {}
-    for port in ports:
-        try:
-            m = ProparMaster(port, baudrate=baudrate)
-            nodes = m.get_nodes() or []
-            mapping[port] = [int(n['address']) for n in nodes]
-            try:
-                m.close()
-            except Exception:
-                pass
-        except Exception as e:
-            print(f"[WARN] Could not open {port}: {e}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=max(1, len(ports))) as pool:
+        for port, addrs in zip(ports, pool.map(_discover_port, ports, [baudrate] * len(ports))):
+            if addrs is not None:
+                mapping[port] = addrs
     return mapping
 
 def _ok_result_list(res_list) -> bool:
@@ -54,40 +65,49 @@ def poll_worker(port: str,
                 address: int,
                 baudrate: int,
                 ddes: List[int],
-                duration: float,
-                start_event: threading.Event,
+                ready: threading.Barrier,
+                stop_event: threading.Event,
                 results: Dict[Tuple[str, int], dict],
                 target_period: float = None,
                 resp_timeout: float = 0.08,
                 byte_timeout: float = 0.005):
     # Prepare instrument + cached params
-    inst = ProparInstrument(port, address=address, baudrate=baudrate)
-    inst.master.response_timeout = float(resp_timeout)
     try:
-        # Some transports expose underlying serial timeout
-        inst.master.propar.serial.timeout = float(byte_timeout)
-    except Exception:
-        pass
+        inst = ProparInstrument(port, address=address, baudrate=baudrate)
+        inst.master.response_timeout = float(resp_timeout)
+        try:
+            # Some transports expose underlying serial timeout
+            inst.master.propar.serial.timeout = float(byte_timeout)
+        except Exception:
+            pass
 
-    params = inst.db.get_parameters(ddes)
+        params = inst.db.get_parameters(ddes)
 
-    # Warm-up read (populate caches, etc.)
-    try:
-        _ = inst.read_parameters(params)
-    except Exception:
-        pass
+        # Warm-up read (populate caches, etc.)
+        try:
+            _ = inst.read_parameters(params)
+        except Exception:
+            pass
+    except Exception as e:
+        print(f"[WARN] {port} addr {address}: setup failed: {e}", file=sys.stderr)
+        inst = None
 
-    # Synchronize start
-    start_event.wait()
+    # Synchronize start: main() arms the stop timer only once every worker is set up,
+    # so setup time never eats into the polling window
+    ready.wait()
+    if inst is None:
+        return
 
-    end_t = time.perf_counter() + duration
     t_prev = None
-    dts = []
+    # packed float64 storage: long free-running runs collect many samples per worker
+    dts = array.array('d')
     successes = 0
     errors = 0
-    read_latencies = []
+    read_latencies = array.array('d')
 
-    while time.perf_counter() < end_t:
+    # stop_event is set by a timer in main() when the duration is up
+    poll_start = time.perf_counter()
+    while not stop_event.is_set():
         t0 = time.perf_counter()
         try:
             res = inst.read_parameters(params) or []
@@ -105,11 +125,17 @@ def poll_worker(port: str,
             errors += 1
 
         if target_period is not None:
-            elapsed = time.perf_counter() - t0
-            sleep_for = target_period - elapsed
-            if sleep_for > 0:
-                # cap sleep quantum to keep responsiveness
-                time.sleep(min(sleep_for, 0.02))
+            # one coalesced wait per cycle: sleep the remainder, spin for sub-ms leftovers
+            sleep_for = target_period - (time.perf_counter() - t0)
+            if sleep_for >= SPIN_THRESHOLD:
+                if stop_event.wait(sleep_for):
+                    break
+            else:
+                # sleep(0) yields the GIL each turn so the other workers keep polling
+                while time.perf_counter() - t0 < target_period and not stop_event.is_set():
+                    time.sleep(0)
+    # rates are computed from the time this worker actually spent polling
+    polled = time.perf_counter() - poll_start
 
     # Summarize
     def _summ(vals):
@@ -130,7 +156,7 @@ def poll_worker(port: str,
         "errors": errors,
         "intervals": _summ(dts),
         "latencies": _summ(read_latencies),
-        "duration": duration,
+        "duration": polled,
         "target_period": target_period,
     }
 
@@ -202,7 +228,9 @@ def main():
     target_period = (args.period if args.mode == "periodic" else None)
 
     # Launch workers: one per (port, first-address)
-    start_event = threading.Event()
+    stop_event = threading.Event()
+    # every worker plus main() meet here once the ports are open and warmed up
+    ready = threading.Barrier(len(addr_map) + 1)
     threads = []
     results: Dict[Tuple[str, int], dict] = {}
 
@@ -211,7 +239,7 @@ def main():
         address = int(addrs[0])
         t = threading.Thread(
             target=poll_worker,
-            args=(port, address, args.baud, ddes, duration, start_event, results, target_period, args.resp_timeout, args.byte_timeout),
+            args=(port, address, args.baud, ddes, ready, stop_event, results, target_period, args.resp_timeout, args.byte_timeout),
             daemon=True
         )
         threads.append(t)
@@ -219,33 +247,37 @@ def main():
     print(f"Starting benchmark for {len(threads)} instrument(s) for {duration:.1f}s (mode={args.mode}, target_period={target_period})...")
     for t in threads:
         t.start()
+    ready.wait()
     t0 = time.perf_counter()
-    start_event.set()
+    stop_timer = threading.Timer(duration, stop_event.set)
+    stop_timer.daemon = True
+    stop_timer.start()
     for t in threads:
         t.join()
     elapsed = time.perf_counter() - t0
 
-    # Report
-    print("\n=== Poll benchmark results ===")
+    # Report: build the whole block and write it once
+    out = ["\n=== Poll benchmark results ==="]
     for (port, address), r in results.items():
         succ = r["successes"]
         errs = r["errors"]
         lat = r["latencies"]
         ints = r["intervals"]
         eff_rate = human_rate(succ, r["duration"])
-        print(f"\n[{port} addr {address}]  {eff_rate}  |  ok={succ} err={errs}")
+        out.append(f"\n[{port} addr {address}]  {eff_rate}  |  ok={succ} err={errs}")
         if target_period is not None:
-            print(f"  target period: {human_time(target_period)}  (target rate {1.0/target_period:.1f} Hz)")
-        print(f"  read latency: mean={human_time(lat['mean'])}, p95={human_time(lat['p95'])}, min={human_time(lat['min'])}, max={human_time(lat['max'])}")
+            out.append(f"  target period: {human_time(target_period)}  (target rate {1.0/target_period:.1f} Hz)")
+        out.append(f"  read latency: mean={human_time(lat['mean'])}, p95={human_time(lat['p95'])}, min={human_time(lat['min'])}, max={human_time(lat['max'])}")
         if ints["count"] > 0:
-            print(f"  inter-arrival: mean={human_time(ints['mean'])}, p95={human_time(ints['p95'])}, min={human_time(ints['min'])}, max={human_time(ints['max'])}")
+            out.append(f"  inter-arrival: mean={human_time(ints['mean'])}, p95={human_time(ints['p95'])}, min={human_time(ints['min'])}, max={human_time(ints['max'])}")
             if target_period is not None:
                 # Jitter vs target
                 jitter = abs(ints['mean'] - target_period) if ints['mean'] is not None else None
-                print(f"  period error (mean): {human_time(jitter)}")
+                out.append(f"  period error (mean): {human_time(jitter)}")
 
-    print(f"\nDone in {elapsed:.2f}s.")
-    print("Tip: For reliable operation, choose a period comfortably above the p95 read latency (e.g., 2× p95).")
+    out.append(f"\nDone in {elapsed:.2f}s.")
+    out.append("Tip: For reliable operation, choose a period comfortably above the p95 read latency (e.g., 2× p95).")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     try:
@@ -1,43 +1,84 @@
 import csv
-from datetime import datetime
+import itertools
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def adjust_csv(file_path):
-    with open(file_path, "r", newline="") as f:
-        reader = list(csv.reader(f))
-    header = reader[0]
-    rows = reader[1:]
+# I/O buffer for the rewrite pass: the logs are small enough that this is one read and one write
+_IO_BUFFER = 1 << 20
 
-    # Find indices for columns
-    kind_idx = header.index("kind")
-    name_idx = header.index("name")
-    ts_idx = header.index("ts")
-    iso_idx = header.index("iso")
+def _column_indices(header):
+    idx = {name: i for i, name in enumerate(header)}
+    return idx["kind"], idx["name"], idx["ts"], idx["iso"]
 
-    # Start from the first timestamp
-    start_ts = float(rows[0][ts_idx])
-    current_ts = start_ts
+def _adjust_rows(header, rows):
+    """Yield rows with fMeasure times respaced 1 h apart and fSetpoint times following them."""
+    # Find indices for columns
+    kind_idx, name_idx, ts_idx, iso_idx = _column_indices(header)
 
-    for i, row in enumerate(rows):
+    current_ts = None
+    for row in rows:
+        if current_ts is None:
+            # Start from the first timestamp
+            current_ts = float(row[ts_idx])
         if row[kind_idx] == "measure" and row[name_idx] == "fMeasure":
-            row[ts_idx] = f"{current_ts:.3f}"
-            row[iso_idx] = datetime.fromtimestamp(current_ts).strftime("%Y-%m-%d %H:%M:%S")
-            last_fmeasure_ts = current_ts
+            row[ts_idx] = "%.3f" % current_ts
+            row[iso_idx] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current_ts))
+            last_fmeasure_ts = row[ts_idx]
             last_fmeasure_iso = row[iso_idx]
             current_ts += 3600  # increment by 1 hour
         elif row[kind_idx] == "setpoint" and row[name_idx] == "fSetpoint":
             # Use previous fMeasure timestamp
-            row[ts_idx] = f"{last_fmeasure_ts:.3f}"
+            row[ts_idx] = last_fmeasure_ts
             row[iso_idx] = last_fmeasure_iso
+        yield row
 
-    with open(file_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
-        writer.writerows(rows)
+def _would_change(file_path, transform):
+    """Whether transform changes any row; stops reading at the first row that differs."""
+    with open(file_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows, originals = itertools.tee(reader)
+        changed = transform(header, map(list, rows))
+        return any(new != old for new, old in zip(changed, originals))
+
+def rewrite_csv(file_path, transform):
+    """
+    Stream the rows of a log through transform(header, rows) and replace the file with the result.
+    A file the transform would not change is only read, never rewritten.
+    """
+    if not _would_change(file_path, transform):
+        return
+    # Stream rows into a temp file next to the original, then swap it in
+    with open(file_path, "r", newline="", buffering=_IO_BUFFER) as fin:
+        reader = csv.reader(fin)
+        header = next(reader)
+
+        fout = tempfile.NamedTemporaryFile("w", newline="", delete=False, buffering=_IO_BUFFER,
+                                           dir=os.path.dirname(file_path) or ".")
+        try:
+            with fout:
+                writer = csv.writer(fout)
+                writer.writerow(header)
+                writer.writerows(transform(header, reader))
+            shutil.copymode(file_path, fout.name)
+        except BaseException:
+            os.unlink(fout.name)
+            raise
+    os.replace(fout.name, file_path)
+
+def adjust_csv(file_path):
+    rewrite_csv(file_path, _adjust_rows)
 
 # Example usage:
-for fname in [
-    "Data/log_CH4_20250923_123710.csv",
-    "Data/log_CO2_20250923_123710.csv",
-    "Data/log_H2_20250923_123710.csv"
-]:
-    adjust_csv(fname)
\ No newline at end of file
+if __name__ == "__main__":
+    files = [
+        "Data/log_CH4_20250923_123710.csv",
+        "Data/log_CO2_20250923_123710.csv",
+        "Data/log_H2_20250923_123710.csv"
+    ]
+    # The logs are independent, so rewrite them in parallel
+    with ProcessPoolExecutor(max_workers=len(files)) as pool:
+        list(pool.map(adjust_csv, files))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that poller error messages are split into port and address
+for both Windows ("COM3/5: ...") and Linux ("/dev/ttyUSB0/5: ...") port names.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.manager import ProparManager
+
+
+def _fake_manager():
+    """Minimal stand-in for ProparManager that records what gets logged."""
+    calls = []
+    logger = SimpleNamespace(
+        log_error=lambda **kw: calls.append(("error", kw)),
+        log_communication_error=lambda **kw: calls.append(("communication", kw)),
+    )
+    mgr = SimpleNamespace(
+        pollerError=SimpleNamespace(emit=lambda msg: None),
+        error_logger=logger,
+        _get_instrument_info=lambda port, address: {},
+        clear_shared_instrument_cache=lambda port, address: calls.append(("clear", (port, address))),
+    )
+    return mgr, calls
+
+
+def test_port_parsing():
+    """Test port/address extraction from poller error messages"""
+    print("🧪 Testing poller error message parsing")
+    print("=" * 60)
+
+    test_cases = [
+        # (message, expected port, expected address, expected kind)
+        ("COM3/5: read failed", "COM3", "5", "communication"),
+        ("/dev/ttyUSB0/5: read failed", "/dev/ttyUSB0", "5", "communication"),
+        ("/dev/ttyUSB0/3: Communication timeout (type: timeout)", "/dev/ttyUSB0", "3", "communication"),
+        ("COM4/7: Port access error (type: permission_denied)", "COM4", "7", "error"),
+        ("/dev/ttyUSB1/2: Serial port closed (type: port_closed)", "/dev/ttyUSB1", "2", "error"),
+        ("/dev/ttyUSB0/x: read failed", "/dev/ttyUSB0/x", "unknown", "error"),
+        ("poller stopped unexpectedly", "unknown", "unknown", "error"),
+    ]
+
+    # One stand-in for every case; only the recorded calls are reset
+    mgr, calls = _fake_manager()
+    for i, (msg, port, address, kind) in enumerate(test_cases, 1):
+        calls.clear()
+        ProparManager._on_poller_error(mgr, msg)
+
+        logged = [c for c in calls if c[0] != "clear"]
+        assert len(logged) == 1, f"Case {i}: expected one log entry, got {calls}"
+        got_kind, kw = logged[0]
+        print(f"   Case {i}: {msg!r} -> port={kw['port']!r} address={kw['address']!r}")
+        assert got_kind == kind, f"Case {i}: expected {kind} log, got {got_kind}"
+        assert kw["port"] == port, f"Case {i}: expected port {port!r}, got {kw['port']!r}"
+        assert kw["address"] == address, f"Case {i}: expected address {address!r}, got {kw['address']!r}"
+
+        if "(type: port_closed)" in msg:
+            assert ("clear", (port, int(address))) in calls, f"Case {i}: shared cache not cleared"
+
+    print("\n✅ All poller error messages parsed correctly")
+
+
+if __name__ == "__main__":
+    test_port_parsing()